@@ -1,7 +1,11 @@
+import csv
+import hashlib
+import io
 import os
 from datetime import datetime
 
 import altair as alt
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -28,11 +32,53 @@ st.sidebar.write(
 # --------------------------------------------------------
 # DATA LOADING
 # --------------------------------------------------------
-@st.cache_data
-def load_data() -> pd.DataFrame:
+# Parsed copies of the Excel file are kept here as Parquet, keyed by file hash.
+# Bump CACHE_VERSION whenever the cleaning in load_data changes.
+CACHE_DIR = ".cache"
+CACHE_VERSION = 5
+
+
+def detect_columns(columns) -> dict:
+    """
+    Find the key columns by name, to be robust to small naming changes.
+    Returns the column for each role, or None when it is not in the file.
+    """
+    return {
+        "name": next((c for c in columns if c.strip().startswith("Nom")), None),
+        "camp": next((c for c in columns if "Camps" in c), None),
+        "sex": next((c for c in columns if "Sexe" in c or "Sex" in c), None),
+        "age": next((c for c in columns if "Age" in c or "Âge" in c or "age" in c), None),
+        "eth": next((c for c in columns if "Ethnie" in c or "Ethnic" in c), None),
+        "pbs": next((c for c in columns if "PBS" in c), None),
+    }
+
+
+# Kobo bookkeeping columns that are always empty in the export. The record IDs
+# (_id, _uuid, _submission_time, ...) are kept to link rows back to Kobo.
+KOBO_EMPTY_COLUMNS = {"_validation_status", "_notes", "_tags"}
+
+
+def keep_column(col) -> bool:
+    """
+    usecols filter for read_excel: drops KOBO_EMPTY_COLUMNS from the frame.
+    pandas still reads every cell of the sheet; this only keeps the frame,
+    the data table and the CSV export free of empty columns.
+    """
+    return col not in KOBO_EMPTY_COLUMNS
+
+
+@st.cache_resource
+def load_data() -> tuple[pd.DataFrame, str]:
     """
     Load the Excel file exported from Kobo.
     The file must be in the same folder as app.py.
+
+    Returns the DataFrame and the SHA-1 of the file. The hash identifies the
+    dataset for the st.cache_data helpers below, which take the frame unhashed.
+
+    The DataFrame is shared by all sessions and reruns (st.cache_resource),
+    so it must never be modified in place. To reload the file, call
+    st.cache_resource.clear() or restart the app.
     """
     candidates = [
         "evaluation_protection_indicators_PRM_VF_-_all_versions_-_labels_-_2024-10-15-11-16-37.xlsx",
@@ -53,46 +99,174 @@ def load_data() -> pd.DataFrame:
         )
         st.stop()
 
-    df = pd.read_excel(path)
-
-    # Try to standardise age to numeric
-    age_col = next((c for c in df.columns if "Age" in c or "Âge" in c or "age" in c), None)
+    with open(path, "rb") as fh:
+        file_hash = hashlib.sha1(fh.read()).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{file_hash}-v{CACHE_VERSION}.parquet")
+
+    # Reuse the parsed copy from a previous run if there is one
+    if os.path.exists(cache_path):
+        try:
+            return pd.read_parquet(cache_path), file_hash
+        except Exception:
+            # Corrupt cache or no Parquet engine, parse the Excel file again
+            pass
+
+    # calamine (Rust) parses xlsx much faster than the default openpyxl engine
+    try:
+        df = pd.read_excel(path, usecols=keep_column, engine="calamine")
+    except ImportError:
+        # python-calamine not installed, fall back to openpyxl
+        df = pd.read_excel(path, usecols=keep_column)
+
+    key_cols = detect_columns(df.columns)
+
+    # Try to standardise age to numeric (smallest integer type if there are no gaps)
+    age_col = key_cols["age"]
     if age_col is not None:
-        df[age_col] = pd.to_numeric(df[age_col], errors="coerce")
+        df[age_col] = pd.to_numeric(df[age_col], errors="coerce", downcast="integer")
+
+    # Low-cardinality columns used by the filters are stored as categoricals,
+    # so isin / value_counts work on integer codes instead of strings
+    for col in (key_cols["camp"], key_cols["sex"], key_cols["pbs"]):
+        if col is not None:
+            df[col] = df[col].astype("category")
 
-    return df
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_parquet(cache_path)
+    except Exception:
+        # The cache is only a speed-up, never block the app on it
+        pass
 
+    return df, file_hash
 
-data = load_data()
 
-# Detect key columns dynamically to be robust to small naming changes
-name_col = next((c for c in data.columns if c.strip().startswith("Nom")), None)
-camp_col = next((c for c in data.columns if "Camps" in c), None)
-sex_col = next((c for c in data.columns if "Sexe" in c or "Sex" in c), None)
-age_col = next((c for c in data.columns if "Age" in c or "Âge" in c or "age" in c), None)
-eth_col = next((c for c in data.columns if "Ethnie" in c or "Ethnic" in c), None)
-pbs_col = next((c for c in data.columns if "PBS" in c), None)
+data, data_key = load_data()
+
+# Same detection as in load_data, so camp / sex / PBS are the categorical columns
+key_cols = detect_columns(data.columns)
+name_col = key_cols["name"]
+camp_col = key_cols["camp"]
+sex_col = key_cols["sex"]
+age_col = key_cols["age"]
+eth_col = key_cols["eth"]
+pbs_col = key_cols["pbs"]
 
 # Identify indicator columns: survey questions with limited distinct answers
 base_cols = {name_col, camp_col, sex_col, age_col, eth_col, pbs_col}
 base_cols = {c for c in base_cols if c is not None}
 candidate_cols = [c for c in data.columns if c not in base_cols and not c.startswith("_")]
 
-indicator_cols = []
-for c in candidate_cols:
-    non_null = data[c].dropna()
-    if non_null.empty:
-        continue
-    nunique = non_null.nunique()
-    # Likert type or categorical questions, not free text comments
-    if 1 < nunique <= 15:
-        indicator_cols.append(c)
+# Likert type or categorical questions, not free text comments
+nunique = data[candidate_cols].nunique()
+indicator_cols = nunique[(nunique > 1) & (nunique <= 15)].index.tolist()
 
 # Helper for shortening long labels
 def short(text: str, n: int = 90) -> str:
     return text if len(text) <= n else text[: n - 3] + "..."
 
 
+# Display labels of the indicator questions, shortened once
+INDICATOR_LABELS = {c: short(c) for c in indicator_cols}
+
+
+@st.cache_data
+def filter_domain(_df: pd.DataFrame, data_key: str, camp_col, sex_col, age_col, pbs_col) -> dict:
+    """
+    Options for the dashboard filters, computed once from the full dataset.
+    The DataFrame is not hashed (leading underscore), data_key (the file hash
+    from load_data) identifies it instead.
+    Camp, sex and PBS are categoricals (see load_data), whose categories are
+    already the sorted distinct values.
+    """
+    domain = {"camps": [], "sexes": [], "age_range": None, "pbs_vals": []}
+    if camp_col is not None:
+        domain["camps"] = list(_df[camp_col].cat.categories)
+    if sex_col is not None:
+        domain["sexes"] = list(_df[sex_col].cat.categories)
+    if age_col is not None and _df[age_col].notna().any():
+        domain["age_range"] = (int(_df[age_col].min()), int(_df[age_col].max()))
+    if pbs_col is not None:
+        domain["pbs_vals"] = [str(v) for v in _df[pbs_col].cat.categories]
+    return domain
+
+
+@st.cache_data(max_entries=8)
+def to_csv_bytes(_df: pd.DataFrame, filter_state: tuple) -> bytes:
+    """
+    CSV export of the filtered data, cached so reruns do not re-encode it.
+    The frame is not hashed, filter_state identifies it (see indicator_counts).
+    """
+    return _df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(max_entries=16)
+def indicator_counts(_df: pd.DataFrame, filter_state: tuple, cols: list) -> pd.DataFrame:
+    """
+    Answer counts for all indicators in one pass over the data:
+    one row per indicator, one column per answer (answers compared as text).
+    The filtered frame is not hashed, filter_state (dataset hash plus the
+    filter selections that produced it) identifies it instead.
+    """
+    # object dtype keeps each column's own values (melt would upcast 1 to 1.0),
+    # so the text keys match df[col].astype(str) used by the answer filter
+    long = (
+        _df[cols]
+        .astype(object)
+        .melt(var_name="indicator", value_name="answer")
+        .dropna(subset=["answer"])
+    )
+    long["answer"] = long["answer"].astype(str)
+    return long.value_counts(sort=False).unstack("answer", fill_value=0)
+
+
+@st.cache_data
+def pbs_yes_flags(_df: pd.DataFrame, data_key: str, pbs_col) -> np.ndarray:
+    """
+    Boolean array marking respondents who self report a disability ("Oui").
+    Keyed on data_key so the flags always line up with the loaded frame.
+    """
+    return _df[pbs_col].astype(str).str.contains("Oui", case=False, na=False).to_numpy()
+
+
+@st.cache_data
+def age_chart_spec(hist: tuple, edges: tuple) -> dict:
+    """Vega-Lite spec of the pre-binned age histogram, cached by bin counts."""
+    hist_df = pd.DataFrame({"age_lo": edges[:-1], "age_hi": edges[1:], "count": hist})
+    age_chart = (
+        alt.Chart(hist_df)
+        .mark_bar()
+        .encode(
+            alt.X("age_lo:Q", title="Age"),
+            alt.X2("age_hi:Q"),
+            alt.Y("count:Q", title="Number of persons"),
+        )
+        .properties(height=300)
+    )
+    return age_chart.to_dict()
+
+
+@st.cache_data
+def response_chart_spec(responses: tuple, counts: tuple) -> dict:
+    """Vega-Lite spec of an indicator's response distribution, cached by counts."""
+    chart_df = pd.DataFrame({"response": responses, "count": counts})
+    resp_chart = (
+        alt.Chart(chart_df)
+        .mark_bar()
+        .encode(
+            x=alt.X("response:N", title="Response"),
+            y=alt.Y("count:Q", title="Number of respondents"),
+        )
+        .properties(height=300)
+    )
+    return resp_chart.to_dict()
+
+
+domain = filter_domain(data, data_key, camp_col, sex_col, age_col, pbs_col)
+CAMPS = domain["camps"]
+SEXES = domain["sexes"]
+
+
 # --------------------------------------------------------
 # PAGE 1 – DASHBOARD
 # --------------------------------------------------------
@@ -104,50 +278,61 @@ if page.startswith("1"):
 
     col_f1, col_f2, col_f3, col_f4 = st.columns(4)
 
-    df = data.copy()
+    # All filters are combined into one boolean mask and applied once below.
+    # A filter left at its default (everything selected) adds no term.
+    mask = np.ones(len(data), dtype=bool)
+    # The dataset and selections that define df, a cheap cache key for it
+    filter_state = [data_key]
 
     # Camp filter
     with col_f1:
         if camp_col is not None:
-            camps = sorted(df[camp_col].dropna().unique())
-            camp_filter = st.multiselect("Camp", camps, default=camps)
-            df = df[df[camp_col].isin(camp_filter)]
+            camp_filter = st.multiselect("Camp", CAMPS, default=CAMPS)
+            filter_state.append(tuple(camp_filter))
+            if len(camp_filter) < len(CAMPS):
+                mask &= data[camp_col].isin(camp_filter).to_numpy()
         else:
             st.info("Camp column not found in dataset.")
 
     # Sex filter
     with col_f2:
         if sex_col is not None:
-            sexes = sorted(df[sex_col].dropna().unique())
-            sex_filter = st.multiselect("Sex", sexes, default=sexes)
-            df = df[df[sex_col].isin(sex_filter)]
+            sex_filter = st.multiselect("Sex", SEXES, default=SEXES)
+            filter_state.append(tuple(sex_filter))
+            if len(sex_filter) < len(SEXES):
+                mask &= data[sex_col].isin(sex_filter).to_numpy()
         else:
             st.info("Sex column not found in dataset.")
 
     # Age filter
     with col_f3:
-        if age_col is not None and df[age_col].notna().any():
-            min_age = int(df[age_col].min())
-            max_age = int(df[age_col].max())
+        if domain["age_range"] is not None:
+            min_age, max_age = domain["age_range"]
             age_range = st.slider(
                 "Age range",
                 min_value=min_age,
                 max_value=max_age,
                 value=(min_age, max_age),
             )
-            df = df[df[age_col].between(age_range[0], age_range[1])]
+            filter_state.append(tuple(age_range))
+            if tuple(age_range) != (min_age, max_age):
+                mask &= data[age_col].between(age_range[0], age_range[1]).to_numpy()
         else:
             st.info("Age column not available or empty.")
 
     # Disability filter
     with col_f4:
         if pbs_col is not None:
-            pbs_vals = sorted(df[pbs_col].dropna().astype(str).unique())
+            pbs_vals = domain["pbs_vals"]
             pbs_filter = st.multiselect("PBS (disability)", pbs_vals, default=pbs_vals)
-            df = df[df[pbs_col].astype(str).isin(pbs_filter)]
+            filter_state.append(tuple(pbs_filter))
+            if len(pbs_filter) < len(pbs_vals):
+                mask &= data[pbs_col].astype(str).isin(pbs_filter).to_numpy()
         else:
             st.info("PBS column not found in dataset.")
 
+    df = data if mask.all() else data.loc[mask]
+
     st.caption(f"Number of interviews after filters: {len(df)}")
 
     if len(df) == 0:
@@ -179,9 +364,7 @@ if page.startswith("1"):
 
     with col_k4:
         if pbs_col is not None:
-            pbs_yes = df[pbs_col].astype(str).str.contains(
-                "Oui", case=False, na=False
-            ).mean()
+            pbs_yes = pbs_yes_flags(data, data_key, pbs_col)[mask].mean()
             st.metric(
                 "Persons with disability (self reported, percent)",
                 f"{round(pbs_yes * 100, 1)} %",
@@ -197,23 +380,19 @@ if page.startswith("1"):
     with col_d1:
         if sex_col is not None:
             st.write("Sex distribution")
-            st.bar_chart(df[sex_col].value_counts())
+            # Categorical: drop the sexes filtered out (count 0)
+            # Plain axis names: Vega-Lite misreads the colon in Kobo column names
+            st.bar_chart(df[sex_col].value_counts().loc[lambda counts: counts > 0].rename_axis("Sex"))
         else:
             st.info("Sex column not available in this dataset.")
 
     with col_d2:
         if age_col is not None and df[age_col].notna().any():
             st.write("Age distribution")
-            age_chart = (
-                alt.Chart(df.dropna(subset=[age_col]))
-                .mark_bar()
-                .encode(
-                    alt.X(f"{age_col}:Q", bin=alt.Bin(maxbins=15), title="Age"),
-                    alt.Y("count()", title="Number of persons"),
-                )
-                .properties(height=300)
-            )
-            st.altair_chart(age_chart, use_container_width=True)
+            # Bin in numpy so the chart only receives one row per bin
+            hist, edges = np.histogram(df[age_col].dropna().to_numpy(), bins=15)
+            spec = age_chart_spec(tuple(hist.tolist()), tuple(edges.tolist()))
+            st.vega_lite_chart(spec, use_container_width=True)
         else:
             st.info("Age column not available or empty.")
 
@@ -222,14 +401,15 @@ if page.startswith("1"):
     with col_d3:
         if camp_col is not None:
             st.write("Distribution by camp")
-            st.bar_chart(df[camp_col].value_counts())
+            # Categorical: drop the camps filtered out (count 0)
+            st.bar_chart(df[camp_col].value_counts().loc[lambda counts: counts > 0].rename_axis("Camp"))
         else:
             st.info("Camp column not available.")
 
     with col_d4:
         if eth_col is not None:
             st.write("Ethnicity distribution")
-            st.bar_chart(df[eth_col].value_counts())
+            st.bar_chart(df[eth_col].value_counts().rename_axis("Ethnicity"))
         else:
             st.info("Ethnicity column not available.")
 
@@ -246,13 +426,18 @@ if page.startswith("1"):
         selected_indicator = st.selectbox(
             "Select an indicator",
             options=indicator_cols,
-            format_func=lambda c: short(c),
+            format_func=INDICATOR_LABELS.get,
         )
 
         st.markdown(f"**Question:** {selected_indicator}")
 
+        # Answer counts for this indicator, looked up from the precomputed table
+        ind_counts = indicator_counts(df, tuple(filter_state), indicator_cols)
+        all_counts = ind_counts.reindex([selected_indicator], fill_value=0).iloc[0]
+        all_counts = all_counts[all_counts > 0]
+
         # Optional filter by answer for this indicator
-        answer_vals = sorted(df[selected_indicator].dropna().astype(str).unique())
+        answer_vals = sorted(all_counts.index)
         answer_filter = st.multiselect(
             "Filter by answer (optional)",
             options=answer_vals,
@@ -263,22 +448,9 @@ if page.startswith("1"):
         st.caption(f"Number of interviews for this indicator after answer filter: {len(df_ind)}")
 
         # Response distribution
-        counts = df_ind[selected_indicator].astype(str).value_counts()
-        resp_chart = (
-            alt.Chart(counts.reset_index())
-            .mark_bar()
-            .encode(
-                x=alt.X("index:N", title="Response"),
-                y=alt.Y(selected_indicator + ":Q", field="count", title="Number of respondents"),
-            )
-            .properties(height=300)
-        )
-        # Work around altair naming
-        resp_chart = alt.Chart(counts.reset_index().rename(columns={"index": "Response", selected_indicator: "Count"})).mark_bar().encode(
-            x=alt.X("Response:N", title="Response"),
-            y=alt.Y("Count:Q", title="Number of respondents"),
-        )
-        st.altair_chart(resp_chart, use_container_width=True)
+        counts = all_counts[all_counts.index.isin(answer_filter)]
+        spec = response_chart_spec(tuple(counts.index), tuple(counts.tolist()))
+        st.vega_lite_chart(spec, use_container_width=True)
 
         # Map common Likert answers to numeric to get simple scores
         likert_map = {
@@ -295,9 +467,9 @@ if page.startswith("1"):
             st.subheader("Summary by camp (higher score usually more positive)")
 
             if camp_col is not None:
-                by_camp = df_ind.groupby(camp_col)["__score__"].mean().dropna().sort_values(ascending=False)
+                by_camp = df_ind.groupby(camp_col, observed=True)["__score__"].mean().dropna().sort_values(ascending=False)
                 if not by_camp.empty:
-                    st.bar_chart(by_camp)
+                    st.bar_chart(by_camp.rename_axis("Camp").rename("Score"))
                 else:
                     st.info("No numeric scores could be calculated for this indicator.")
             else:
@@ -307,23 +479,16 @@ if page.startswith("1"):
         st.subheader("Cross analysis: sex x indicator")
 
         if sex_col is not None:
+            # Answers as rows, one bar series per sex
             cross_sex = (
-                df_ind.groupby([sex_col, selected_indicator])
-                .size()
-                .reset_index(name="count")
+                df_ind[[sex_col, selected_indicator]]
+                .value_counts(sort=False)
+                .loc[lambda counts: counts > 0]
+                .unstack(sex_col, fill_value=0)
+                .rename_axis(index="Response", columns=None)
             )
             if not cross_sex.empty:
-                cross_chart_sex = (
-                    alt.Chart(cross_sex)
-                    .mark_bar()
-                    .encode(
-                        x=alt.X(f"{selected_indicator}:N", title="Response"),
-                        y=alt.Y("count:Q", title="Number"),
-                        color=sex_col + ":N",
-                        column=sex_col + ":N",
-                    )
-                )
-                st.altair_chart(cross_chart_sex, use_container_width=True)
+                st.bar_chart(cross_sex)
             else:
                 st.info("No data for this cross analysis.")
         else:
@@ -333,23 +498,16 @@ if page.startswith("1"):
         st.subheader("Cross analysis: camp x indicator")
 
         if camp_col is not None:
+            # Answers as rows, one bar series per camp
             cross_camp = (
-                df_ind.groupby([camp_col, selected_indicator])
-                .size()
-                .reset_index(name="count")
+                df_ind[[camp_col, selected_indicator]]
+                .value_counts(sort=False)
+                .loc[lambda counts: counts > 0]
+                .unstack(camp_col, fill_value=0)
+                .rename_axis(index="Response", columns=None)
             )
             if not cross_camp.empty:
-                cross_chart_camp = (
-                    alt.Chart(cross_camp)
-                    .mark_bar()
-                    .encode(
-                        x=alt.X(f"{selected_indicator}:N", title="Response"),
-                        y=alt.Y("count:Q", title="Number"),
-                        color=camp_col + ":N",
-                        column=camp_col + ":N",
-                    )
-                )
-                st.altair_chart(cross_chart_camp, use_container_width=True)
+                st.bar_chart(cross_camp)
             else:
                 st.info("No data for this cross analysis.")
         else:
@@ -359,23 +517,16 @@ if page.startswith("1"):
         st.subheader("Cross analysis: disability (PBS) x indicator")
 
         if pbs_col is not None:
+            # Answers as rows, one bar series per PBS value
             cross_pbs = (
-                df_ind.groupby([pbs_col, selected_indicator])
-                .size()
-                .reset_index(name="count")
+                df_ind[[pbs_col, selected_indicator]]
+                .value_counts(sort=False)
+                .loc[lambda counts: counts > 0]
+                .unstack(pbs_col, fill_value=0)
+                .rename_axis(index="Response", columns=None)
             )
             if not cross_pbs.empty:
-                cross_chart_pbs = (
-                    alt.Chart(cross_pbs)
-                    .mark_bar()
-                    .encode(
-                        x=alt.X(f"{selected_indicator}:N", title="Response"),
-                        y=alt.Y("count:Q", title="Number"),
-                        color=pbs_col + ":N",
-                        column=pbs_col + ":N",
-                    )
-                )
-                st.altair_chart(cross_chart_pbs, use_container_width=True)
+                st.bar_chart(cross_pbs)
             else:
                 st.info("No data for this cross analysis.")
         else:
@@ -385,10 +536,10 @@ if page.startswith("1"):
     st.subheader("Filtered data table")
     st.dataframe(df, use_container_width=True)
 
-    csv = df.to_csv(index=False).encode("utf-8")
+    csv_bytes = to_csv_bytes(df, tuple(filter_state))
     st.download_button(
         label="Download filtered data (CSV)",
-        data=csv,
+        data=csv_bytes,
         file_name="protection_evaluation_filtered.csv",
         mime="text/csv",
     )
@@ -404,8 +555,28 @@ else:
         "It is mainly for learning and demonstration, not for production data collection."
     )
 
+    # Columns of a saved interview, in export order
+    new_columns = [
+        "submission_time",
+        "Nom",
+        camp_col if camp_col is not None else "Camp",
+        sex_col if sex_col is not None else "Sex",
+        age_col if age_col is not None else "Age",
+        pbs_col if pbs_col is not None else "PBS",
+        "comments",
+        *indicator_cols,
+    ]
+
+    # Interviews are stored column-wise (one list per column) so the table
+    # can be built without converting a list of dicts on every rerun
     if "new_responses" not in st.session_state:
-        st.session_state["new_responses"] = []
+        st.session_state["new_responses"] = {c: [] for c in new_columns}
+
+    # The CSV export grows one row per submitted interview instead of being
+    # re-encoded from the whole table on every rerun
+    if "csv_buf" not in st.session_state:
+        st.session_state["csv_buf"] = io.StringIO()
+        csv.writer(st.session_state["csv_buf"], lineterminator="\n").writerow(new_columns)
 
     with st.form("protection_form"):
         st.subheader("Basic information")
@@ -415,8 +586,7 @@ else:
             name_val = st.text_input("Name or code of respondent", "")
         with col_b:
             if camp_col is not None:
-                camps = sorted(data[camp_col].dropna().unique())
-                camp_val = st.selectbox("Camp", camps)
+                camp_val = st.selectbox("Camp", CAMPS)
             else:
                 camp_val = st.text_input("Camp", "")
         with col_c:
@@ -448,9 +618,9 @@ else:
                 opts = sorted(data[col].dropna().astype(str).unique())
                 # If too many options, treat as free text rather than radio
                 if len(opts) <= 10:
-                    responses[col] = st.radio(short(col), opts, horizontal=False)
+                    responses[col] = st.radio(INDICATOR_LABELS[col], opts, horizontal=False)
                 else:
-                    responses[col] = st.text_input(short(col))
+                    responses[col] = st.text_input(INDICATOR_LABELS[col])
 
         comments_val = st.text_area(
             "Additional comments or protection concerns (optional)"
@@ -469,18 +639,22 @@ else:
                 "comments": comments_val,
             }
             new_record.update(responses)
-            st.session_state["new_responses"].append(new_record)
+            for c, values in st.session_state["new_responses"].items():
+                values.append(new_record.get(c))
+            csv.writer(st.session_state["csv_buf"], lineterminator="\n").writerow(
+                [new_record.get(c) for c in new_columns]
+            )
             st.success("Interview saved in the current session.")
 
     st.subheader("Interviews entered in this session")
 
-    if len(st.session_state["new_responses"]) == 0:
+    if len(st.session_state["new_responses"]["submission_time"]) == 0:
         st.info("No interviews recorded yet in this session.")
     else:
-        new_df = pd.DataFrame(st.session_state["new_responses"])
+        new_df = pd.DataFrame(st.session_state["new_responses"], copy=False)
         st.dataframe(new_df, use_container_width=True)
 
-        csv_new = new_df.to_csv(index=False).encode("utf-8")
+        csv_new = st.session_state["csv_buf"].getvalue().encode("utf-8")
         st.download_button(
             label="Download new interviews (CSV)",
             data=csv_new,